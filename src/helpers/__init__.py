@@ -2,6 +2,6 @@
     Package: helpers
 '''
 
-from .constants import Color, GameOverStatus, COLOR_MAP, UNICODE_PIECES, Position
+from .constants import Color, GameOverStatus, COLOR_MAP, UNICODE_PIECES, Position, SQUARES
 from .functions import col_to_int, int_to_col
 from .custom_errors import IllegalMoveError, InvalidFenError, InvalidMoveInputError
\ No newline at end of file
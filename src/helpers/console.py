@@ -1,11 +1,23 @@
 '''./src/helpers/console.py'''
 
+from __future__ import annotations
 import os
-from typing import Sequence, Optional
+import select
+import sys
+from typing import Sequence, Optional, TYPE_CHECKING
 
 import questionary
+from prompt_toolkit import print_formatted_text
+from prompt_toolkit.formatted_text import FormattedText
 
-from ..models.game import Game, GameOver
+try:
+    import termios
+    import tty
+except ImportError: # not available on Windows, `get_list_input_fast` uses questionary there
+    termios = None
+
+if TYPE_CHECKING:
+    from ..models.game import Game, GameOver
 
 
 Choice = questionary.Choice
@@ -24,6 +36,17 @@ style = questionary.Style([
 
 print_prettier = questionary.print
 
+Fragments = list[tuple[str, str]] # (style, text) pairs, printed together by `print_fragments`
+
+_HEADER_CACHE: dict[str, Fragments] = {} # playing header of each game mode, never mutated
+
+_KEY_UP = b'\x1b[A'
+_KEY_DOWN = b'\x1b[B'
+_KEY_EOF = b'\x04'
+
+_SAVE_CURSOR = '\x1b7'
+_RESTORE_CURSOR = '\x1b8'
+
 def clear() -> int:
     '''
     Clears the console and prints a default message.
@@ -54,11 +77,101 @@ def clear_playing(msg: str = 'chess') -> int:
     '''
 
     status: int = os.system('cls') if os.name == 'nt' else os.system('clear')
-    print_prettier('\n\t ---- Playing ', style=PRINCIPAL_STYLE, end='')
-    print_prettier(msg, style=SECONDARY_STYLE, end='')
-    print_prettier('! ---- \n', style=PRINCIPAL_STYLE)
+    print_fragments(playing_header(msg))
+    return status
+
+def print_fragments(fragments: Fragments) -> None:
+    '''
+    Prints styled text fragments with a single write to the console.
+
+    Parameters
+    ----------
+    `fragments : Fragments`
+        The (style, text) pairs to print.
+    '''
+
+    print_formatted_text(FormattedText(fragments), end='')
+
+def print_playing(game_mode: str, game: Game, msg: str = '') -> int:
+    '''
+    Clears the console and prints a whole frame of the game (header, board, turn and
+    message), saving the cursor position after the turn for `print_message`.
+
+    Parameters
+    ----------
+    `game_mode : str`
+        The game mode being played.
+    `game : Game`
+        The game to print.
+    `msg : str`
+        A message to print after the turn, as is (empty for no message).
+
+    Returns
+    -------
+    `int`
+        The status of the clear command.
+    '''
+
+    status: int = os.system('cls') if os.name == 'nt' else os.system('clear')
+
+    print_fragments(playing_header(game_mode) + game_fragments(game) + turn_fragments(game.turn))
+    if termios is not None: # no cursor escape codes on the Windows console
+        sys.stdout.write(_SAVE_CURSOR)
+    sys.stdout.write(msg)
+    sys.stdout.flush()
     return status
 
+def print_message(game_mode: str, game: Game, msg: str) -> None:
+    '''
+    Replaces everything printed under the turn of the last frame (prompts and message)
+    by the given message, leaving the board on screen. On the Windows console the whole
+    frame is printed again instead.
+
+    Parameters
+    ----------
+    `game_mode : str`
+        The game mode being played.
+    `game : Game`
+        The game on screen.
+    `msg : str`
+        The message to print, as is (empty for no message).
+    '''
+
+    if termios is None:
+        print_playing(game_mode, game, msg)
+        return
+
+    # back to the end of the last frame (saved again, some terminals forget it once
+    # restored), and clear the screen from there
+    sys.stdout.write(f'{_RESTORE_CURSOR}{_SAVE_CURSOR}\x1b[J{msg}')
+    sys.stdout.flush()
+
+def playing_header(msg: str = 'chess') -> Fragments:
+    '''
+    Returns the header printed while playing (built once per game mode).
+
+    Parameters
+    ----------
+    `msg : str`
+        The game mode being played.
+
+    Returns
+    -------
+    `Fragments`
+        The styled header.
+    '''
+
+    header = _HEADER_CACHE.get(msg)
+
+    if header is None:
+        header = _HEADER_CACHE[msg] = [
+            (PRINCIPAL_STYLE, '\n\t ---- Playing '),
+            (SECONDARY_STYLE, msg),
+            (PRINCIPAL_STYLE, '! ---- \n\n'),
+        ]
+
+    return header
+
 def get_text_input(question: str) -> str:
     '''
     Asks the user to enter a text.
@@ -99,6 +212,94 @@ def get_list_input(question: str, choices: Sequence[str]) -> str:
             style = style
         ).ask()
 
+def get_list_input_fast(question: str, choices: Sequence[str]) -> str:
+    '''
+    Asks the user to select a choice from a list of choices, reading single keystrokes
+    from the terminal: the number of a choice selects it at once, the arrows move the
+    pointer and enter selects the pointed choice.
+    Falls back to `get_list_input` when the console is not a terminal.
+
+    Parameters
+    ----------
+    `question : str`
+        The question to ask the user.
+    `choices : Sequence[str]`
+        The list of choices (at most 9, so each one has a single digit).
+
+    Returns
+    -------
+    `str`
+        The choice selected by the user.
+
+    Raises
+    ------
+    `EOFError`
+        If the input ends before a choice is selected.
+    '''
+
+    if termios is None or not sys.stdin.isatty() or len(choices) > 9:
+        return get_list_input(question, choices)
+
+    fd = sys.stdin.fileno()
+    old_attrs = termios.tcgetattr(fd)
+    index = 0
+    digits = b'123456789'[:len(choices)]
+
+    print_fragments(
+        _question_fragments(question) + [('', '\n')] + _choice_fragments(choices, index)
+    )
+
+    try:
+        tty.setcbreak(fd)
+        while True:
+            # raw bytes from the descriptor, so `select` sees exactly what is still pending
+            key = os.read(fd, 1)
+            if key == b'\x1b' and select.select([fd], [], [], 0)[0]:
+                key += os.read(fd, 2) # rest of an arrow key sequence, not a lone Esc
+
+            if key and key in digits:
+                index = digits.index(key)
+                break
+            # end of the input, or ctrl-D (the terminal leaves it to us in cbreak mode)
+            if key == b'' or key == _KEY_EOF:
+                raise EOFError
+            if key == b'\n' or key == b'\r':
+                break
+            if key == _KEY_UP or key == _KEY_DOWN:
+                index = (index + (1 if key == _KEY_DOWN else -1)) % len(choices)
+                sys.stdout.write(f'\x1b[{len(choices)}A\r') # back to the first choice
+                print_fragments(_choice_fragments(choices, index))
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+
+    # replace the question and the choices by the answered question
+    sys.stdout.write(f'\x1b[{len(choices) + 1}A\r\x1b[J')
+    print_fragments(
+        _question_fragments(question) + [(SECONDARY_STYLE, f' {choices[index]}\n')]
+    )
+
+    return choices[index]
+
+def _question_fragments(question: str) -> Fragments:
+    '''
+    Returns the question line of `get_list_input_fast`, styled like the questionary prompts.
+    '''
+
+    return [(PRINCIPAL_STYLE, '? '), ('bold', question)]
+
+def _choice_fragments(choices: Sequence[str], index: int) -> Fragments:
+    '''
+    Returns the choices of `get_list_input_fast`, with the pointer on the given one.
+    '''
+
+    fragments: Fragments = []
+    for i, choice in enumerate(choices):
+        if i == index:
+            fragments.append((PRINCIPAL_STYLE, f' » {i + 1}) {choice}\n'))
+        else:
+            fragments.append(('', f'   {i + 1}) {choice}\n'))
+    return fragments
+
 def get_choices_input(
         question: str,
         choices: Sequence[str],
@@ -134,19 +335,26 @@ def get_choices_input(
             style = style
         ).ask()
 
-def print_turn(turn: str) -> None:
+def turn_fragments(turn: str) -> Fragments:
     '''
-    Prints the turn of the player to move.
+    Returns the line with the turn of the player to move.
 
     Parameters
     ----------
     `turn : str`
         The turn of the player to move.
+
+    Returns
+    -------
+    `Fragments`
+        The styled turn line.
     '''
 
-    print_prettier('\nTurn: ', style=PRINCIPAL_STYLE, end='')
-    print_prettier(turn, style='bold', end='')
-    print_prettier(' to move\n', style=PRINCIPAL_STYLE)
+    return [
+        (PRINCIPAL_STYLE, '\nTurn: '),
+        ('bold', turn),
+        (PRINCIPAL_STYLE, ' to move\n\n'),
+    ]
 
 def print_game(game: Game) -> None:
     '''
@@ -158,8 +366,27 @@ def print_game(game: Game) -> None:
         The game to print.
     '''
 
-    print_prettier(str(game), style='bold')
-    print_prettier(repr(game), style='fg:grey')
+    print_fragments(game_fragments(game))
+
+def game_fragments(game: Game) -> Fragments:
+    '''
+    Returns the board and the FEN of the game.
+
+    Parameters
+    ----------
+    `game : Game`
+        The game to print.
+
+    Returns
+    -------
+    `Fragments`
+        The styled board and FEN.
+    '''
+
+    return [
+        ('bold', str(game) + '\n'),
+        ('fg:grey', repr(game) + '\n'),
+    ]
 
 def print_game_over(game: Game, game_over: GameOver) -> None:
     '''
@@ -180,7 +407,7 @@ def print_game_over(game: Game, game_over: GameOver) -> None:
     print_prettier('\nGame Over!', style=PRINCIPAL_STYLE, end='\n\n')
 
     print_prettier(game_over.score, style=SECONDARY_STYLE, end=' ')
-    if game_over.winner:
+    if game_over.winner is not None:
         print_prettier(f'{game_over.winner.name.lower()} wins! by', style='bold', end=' ')
     else:
         print_prettier('It is a Draw! by', style='bold', end=' ')
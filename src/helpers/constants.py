@@ -1,15 +1,15 @@
 '''./src/helpers/constants.py'''
 
 from dataclasses import dataclass
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 from typing import Self, Literal
 
 from .functions import col_to_int, int_to_col
 
 
-class Color(Enum):
-    WHITE = auto(),
-    BLACK = auto()
+class Color(IntEnum):
+    WHITE = 0 # values index the per-color tables directly
+    BLACK = 1
 
 
 class GameOverStatus(Enum):
@@ -37,22 +37,24 @@ UNICODE_PIECES: dict[str, str] = {
 
 
 @dataclass
-class Position(tuple[str, int]):
+class Position(tuple[int, int]):
     '''
     Position on the board
 
     Attributes
     ----------
-    `col: str`
-        The column of the position
+    `file: int`
+        The column of the position as an index (0 for 'a', 7 for 'h')
     `row: int`
         The row of the position
+    `sq: int`
+        The index of the square (0 for a1, 63 for h8), computed once on creation
 
     Operators
     ---------
     `__str__() -> str`
         Returns the string representation of the position.
-    `__getitem__(index: Literal['row', 'col']) -> int | str`
+    `__getitem__(index: Literal['row', 'col', 'file']) -> int | str`
         Returns the row or column of the position.
     `__eq__(other: Position) -> bool`
         Returns True if the positions are equal.
@@ -62,49 +64,61 @@ class Position(tuple[str, int]):
         Returns the position after subtracting the given tuple from the position.
     `__ne__(other: Position) -> bool`
         Returns True if the positions are not equal.
-    `__next__() -> Position`
-        Returns the next position.
     
+    Properties
+    ----------
+    `col: str`
+        The column of the position as a letter (only for display and parsing).
+
     Methods
     -------
+    `from_sq(sq: int) -> Position`
+        Returns the position of the given square index.
     `diff(other: Position) -> tuple[int, int]`
         Returns the difference between the positions.
     '''
 
-    col: str
+    file: int
     row: int
 
-    def __new__(cls, col: str, row: int) -> Self:
-        return super().__new__(cls, (col, row))
+    def __new__(cls, col: str | int, row: int) -> Self:
+        return super().__new__(cls, (col if isinstance(col, int) else col_to_int(col), row))
 
-    def __init__(self, col: str, row: int) -> None:
-        self.col: str = col
+    def __init__(self, col: str | int, row: int) -> None:
+        self.file: int = tuple.__getitem__(self, 0) # column already converted by `__new__`
         self.row: int = row
+        self.sq: int = self.file + 8 * (row - 1)
 
     def __str__(self) -> str:
         return f'{self.col}{self.row}'
     
-    def __getitem__(self, index: Literal['row', 'col']) -> int | str:
+    def __getitem__(self, index: Literal['row', 'col', 'file']) -> int | str:
         return getattr(self, index)
     
-    def __eq__(self, other: Self) -> bool:
-        return str(self) == str(other)
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Position):
+            return NotImplemented
+        return self.file == other.file and self.row == other.row
 
     def __add__(self, other: tuple[int, int]) -> Self:
-        return Position(int_to_col(col_to_int(self.col) + other[0]), self.row + other[1])
+        return Position(self.file + other[0], self.row + other[1])
     
     def __sub__(self, other: tuple[int, int]) -> Self:
-        return Position(int_to_col(col_to_int(self.col) - other[0]), self.row - other[1])
+        return Position(self.file - other[0], self.row - other[1])
     
-    def __ne__(self, other: Self) -> bool:
+    def __ne__(self, other: object) -> bool:
         return not self == other
     
-    def __next__(self) -> Self:
-        if self.col == 'h':
-            if self.row == 8:
-                raise StopIteration
-            return Position('a', self.row + 1)
-        return Position(int_to_col(col_to_int(self.col) + 1), self.row)
+    @property
+    def col(self) -> str:
+        return int_to_col(self.file)
+
+    @classmethod
+    def from_sq(cls, sq: int) -> Self:
+        return SQUARES[sq]
 
     def diff(self, other: Self) -> tuple[int, int]:
-        return (col_to_int(self.col) - col_to_int(other.col), self.row - other.row)
+        return (self.file - other.file, self.row - other.row)
+
+
+SQUARES: tuple[Position, ...] = tuple(Position(sq & 7, (sq >> 3) + 1) for sq in range(64))
@@ -3,6 +3,14 @@
 from typing import Callable
 
 
-col_to_int: Callable[[str], int] = lambda col: ord(col) - 97
+COL_LUT: bytearray = bytearray(b'\xff' * 256) # file index of each column letter, indexed by `ord`
+COL_LUT[ord('a'):ord('h') + 1] = bytes(range(8))
 
-int_to_col: Callable[[int], str] = lambda num: chr(num + 97)
\ No newline at end of file
+
+def col_to_int(col: str) -> int:
+    code = ord(col)
+    if code > 0xff or COL_LUT[code] == 0xff:
+        raise ValueError(f'Invalid column: {col!r}')
+    return COL_LUT[code]
+
+int_to_col: Callable[[int], str] = lambda num: chr(num + 97)
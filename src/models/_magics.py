@@ -0,0 +1,43 @@
+'''./src/models/_magics.py'''
+
+# Magic multipliers for the slider attack tables of `sliders.py`, one per square (a1 to h8).
+# Found by a random trial search with the shift of each square set to the number of
+# relevant occupancy bits, so every table has exactly 2 ** bits entries.
+
+ROOK_MAGICS: tuple[int, ...] = (
+    0x258000815028C000, 0x0540021002442000, 0x8100110020000842, 0x4080100008008004,
+    0x8200100802000520, 0x0200100804020001, 0x0880020015000880, 0x0300042610408100,
+    0x0600802080004005, 0x0800402010004000, 0x4284801002802000, 0x1001000821001002,
+    0x0002808004000800, 0x0002001002000408, 0x0045001412000100, 0x00820021088C4402,
+    0x0140008000288840, 0x1020014001300048, 0x6060008010002082, 0x0038010100100020,
+    0x0208004004020040, 0x1800808002000400, 0x2C00040001081002, 0x00009A0001004484,
+    0x1200400080208000, 0x00C0004040201000, 0x4000200080100080, 0x0000080080100080,
+    0x0020040080800800, 0x8080040080020080, 0x0084020400081001, 0x6000040200284889,
+    0x0080002000404000, 0x6070004000402000, 0x2000204082001200, 0x0020100101000C21,
+    0x0403080101000411, 0x5040040080800200, 0x020E000406000809, 0x0000010082000044,
+    0x000040008000802A, 0xA810052008484000, 0x0030002000808010, 0x4000100008008080,
+    0x8008080011010005, 0x1801401004880120, 0x0820100201840008, 0x0201004120820004,
+    0x1080008040002080, 0x0101008030420200, 0x3021002000104100, 0x0000201001040900,
+    0xA018040080080180, 0x0002040080020080, 0x00483032484D0400, 0x0200040041208200,
+    0x0308104021088202, 0x8012441081002206, 0x81201100400A2001, 0x0030000408201101,
+    0x0042001004210882, 0x4402000801100482, 0x2004082201100084, 0x00127C0700E0C082,
+)
+
+BISHOP_MAGICS: tuple[int, ...] = (
+    0x0040088200820010, 0x4002100D62008002, 0x0011110A02012220, 0x0084105200031842,
+    0x8244042205000004, 0x2002120220100502, 0x2104008808894821, 0x0828C20150280434,
+    0x01C0A002320A0420, 0x04011210021E8100, 0x0866108082104100, 0x2000040408840008,
+    0x0000011040800046, 0x6000010120100000, 0x800C00481210101B, 0x0E4800C40AC41000,
+    0x0015282808488800, 0x00080022100C0084, 0x0604100204041200, 0x0288002420441000,
+    0x2094008822081402, 0x0001400808082C00, 0x1802070B48222840, 0x000340802C060800,
+    0x00A0440212100A00, 0x03021004200400E0, 0x0002208830050040, 0x0004200824010004,
+    0x000604004200820A, 0x402104082A008404, 0x5188120200421288, 0x1840888082020082,
+    0x1108044000100200, 0x4014044404021004, 0x0000442082100101, 0x1104020080080080,
+    0x5422008400020020, 0x0001280A00002200, 0x0210040080824A22, 0x0002240100802080,
+    0x0001086011220448, 0x0404008804000880, 0x0202010048000100, 0x0010004010448200,
+    0x2609012124000A01, 0x004005080080130A, 0x8004082204018840, 0x4002208401000080,
+    0x0082080405040000, 0x000109008220000A, 0x0000104044108084, 0x140C400084040000,
+    0x0010880420820010, 0x2802208441620018, 0x404808A860840000, 0x1004012401061000,
+    0x2080150808023820, 0x0008050401010804, 0x2210000080844110, 0x040040000842020C,
+    0x104000402003440C, 0x8040002020223081, 0x4801111002080041, 0x80042802024C1101,
+)
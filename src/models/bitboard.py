@@ -0,0 +1,144 @@
+'''./src/models/bitboard.py'''
+
+from ..helpers import Color
+
+
+BitBoard = int # one bit per square, bit 0 is a1 and bit 63 is h8
+
+FULL: BitBoard = 0xFFFFFFFFFFFFFFFF
+
+NOT_A_FILE: BitBoard = 0xFEFEFEFEFEFEFEFE
+NOT_AB_FILE: BitBoard = 0xFCFCFCFCFCFCFCFC
+NOT_H_FILE: BitBoard = 0x7F7F7F7F7F7F7F7F
+NOT_GH_FILE: BitBoard = 0x3F3F3F3F3F3F3F3F
+
+
+def rank_span(sq_a: int, sq_b: int) -> BitBoard:
+    '''
+    Returns the squares from one square to another of the same rank (both included).
+
+    Parameters
+    ----------
+    `sq_a: int`
+        The first square
+    `sq_b: int`
+        The second square
+
+    Returns
+    -------
+    `BitBoard`
+        The squares between both squares, inclusive
+    '''
+
+    low, high = (sq_a, sq_b) if sq_a <= sq_b else (sq_b, sq_a)
+    return (1 << (high + 1)) - (1 << low)
+
+def knight_attacks(bb: BitBoard) -> BitBoard:
+    '''
+    Returns the squares attacked by the knights of a bitboard.
+
+    Parameters
+    ----------
+    `bb: BitBoard`
+        The squares of the knights
+
+    Returns
+    -------
+    `BitBoard`
+        The attacked squares
+    '''
+
+    return (
+        ((bb << 17) & NOT_A_FILE) | ((bb << 15) & NOT_H_FILE) |
+        ((bb << 10) & NOT_AB_FILE) | ((bb << 6) & NOT_GH_FILE) |
+        ((bb >> 17) & NOT_H_FILE) | ((bb >> 15) & NOT_A_FILE) |
+        ((bb >> 10) & NOT_GH_FILE) | ((bb >> 6) & NOT_AB_FILE)
+    ) & FULL
+
+def king_attacks(bb: BitBoard) -> BitBoard:
+    '''
+    Returns the squares attacked by the kings of a bitboard.
+
+    Parameters
+    ----------
+    `bb: BitBoard`
+        The squares of the kings
+
+    Returns
+    -------
+    `BitBoard`
+        The attacked squares
+    '''
+
+    sides = ((bb << 1) & NOT_A_FILE) | ((bb >> 1) & NOT_H_FILE)
+    row = bb | sides
+    return (sides | (row << 8) | (row >> 8)) & FULL
+
+def pawn_attacks(bb: BitBoard, color: Color) -> BitBoard:
+    '''
+    Returns the squares attacked by the pawns of a bitboard.
+
+    Parameters
+    ----------
+    `bb: BitBoard`
+        The squares of the pawns
+    `color: Color`
+        The color of the pawns
+
+    Returns
+    -------
+    `BitBoard`
+        The attacked squares
+    '''
+
+    if color == Color.WHITE:
+        return (((bb << 9) & NOT_A_FILE) | ((bb << 7) & NOT_H_FILE)) & FULL
+    # else:
+    return ((bb >> 7) & NOT_A_FILE) | ((bb >> 9) & NOT_H_FILE)
+
+
+def pawn_pushes(bb: BitBoard, color: Color) -> BitBoard:
+    '''
+    Returns the squares in front of the pawns of a bitboard.
+
+    Parameters
+    ----------
+    `bb: BitBoard`
+        The squares of the pawns
+    `color: Color`
+        The color of the pawns
+
+    Returns
+    -------
+    `BitBoard`
+        The squares one step forward
+    '''
+
+    if color == Color.WHITE:
+        return (bb << 8) & FULL
+    # else:
+    return bb >> 8
+
+
+KNIGHT_ATTACKS: tuple[BitBoard, ...] = tuple(knight_attacks(1 << sq) for sq in range(64))
+
+KING_ATTACKS: tuple[BitBoard, ...] = tuple(king_attacks(1 << sq) for sq in range(64))
+
+# pawn tables are indexed by color first: PAWN_ATTACKS[color][sq]
+
+PAWN_ATTACKS: tuple[tuple[BitBoard, ...], ...] = tuple(
+    tuple(pawn_attacks(1 << sq, color) for sq in range(64)) for color in Color
+)
+
+PAWN_QUIET: tuple[tuple[BitBoard, ...], ...] = tuple(
+    tuple(pawn_pushes(1 << sq, color) for sq in range(64)) for color in Color
+)
+
+PAWN_DOUBLE: tuple[tuple[BitBoard, ...], ...] = tuple(
+    tuple(
+        pawn_pushes(pawn_pushes(1 << sq, color), color)
+        if sq >> 3 == (1 if color == Color.WHITE else 6) else 0
+        for sq in range(64)
+    )
+    for color in Color
+)
@@ -1,18 +1,29 @@
 '''./src/models/board.py'''
 
 import re
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import List, Optional, Generator, Type, Self, Callable
 from itertools import groupby
-from functools import reduce
 
 from .piece import Piece
-from .pieces import King, Rook, Pawn, Queen
-from ..helpers import col_to_int, int_to_col, Color, Position, UNICODE_PIECES
+from .bitboard import (
+    BitBoard, KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, knight_attacks, king_attacks, pawn_attacks
+)
+from .sliders import bishop_attacks, rook_attacks
+from .pieces import Pawn, Knight, Bishop, Rook, Queen, King
+from ..helpers import Color, Position, SQUARES, UNICODE_PIECES
 from ..helpers import config
 from ..helpers.custom_errors import InvalidFenError
 
 
+PIECE_TO_BYTE: dict[tuple[Type[Piece], Color], int] = {
+    (piece_type, color): ord(char.upper() if color == Color.WHITE else char)
+    for piece_type, char in zip((Pawn, Knight, Bishop, Rook, Queen, King), 'pnbrqk')
+    for color in Color
+}
+
+
 @dataclass(slots= True)
 class Board:
     '''
@@ -20,8 +31,8 @@ class Board:
 
     Attributes
     ----------
-    `matrix: List[List[Optional[Piece]]]`
-        Matrix of pieces on the board
+    `squares: List[Optional[Piece]]`
+        Pieces on the board indexed by square (0 for a1, 63 for h8)
     `kings: dict[Color, King]`
         Dictionary of kings on the board
     `turn: str`
@@ -30,8 +41,14 @@ class Board:
         Position of the en passant
     `castling: str`
         Castling availability
-    `move_history: List[str]`
+    `move_history: List[bytes]`
         List of moves made
+    `position_counts: Counter[bytes]`
+        Number of times each position of `move_history` has occured
+    `occupancy: list[BitBoard]`
+        Bitboard of the squares occupied by each color (indexed by color)
+    `bitboards: dict[tuple[Color, Type[Piece]], BitBoard]`
+        Bitboard of the squares occupied by each type of piece of each color
     
     Operators
     ---------
@@ -39,11 +56,11 @@ class Board:
         Returns the string representation of the board
     `__repr__(self) -> str`
         Returns the FEN of the board
-    `__getitem__(self, pos: Position) -> Optional[Piece]`
-        Returns the piece at the given position
-    `__setitem__(self, pos: Position, piece: Piece) -> None`
+    `__getitem__(self, pos: int | str | Position) -> Optional[Piece]`
+        Returns the piece at the given position (or square index)
+    `__setitem__(self, pos: int | str | Position, piece: Piece) -> None`
         Sets the piece at the given position
-    `__delitem__(self, pos: Position) -> None`
+    `__delitem__(self, pos: int | str | Position) -> None`
         Deletes the piece at the given position
     `__contains__(self, piece: Piece) -> bool`
         Returns True if the piece is on the board
@@ -58,12 +75,26 @@ class Board:
         Create a board from a FEN string
     `load_fen(self, fen: str, pieces_from_fen: dict[str, Type[Piece]]) -> None`
         Load a FEN string into the board
+    `pieces_of(self, color: Color) -> list[Piece]`
+        Get the pieces of a color
+    `own_bb(self, color: Color) -> BitBoard`
+        Get the bitboard of the squares occupied by a color
     `get_king(self, color: Color) -> King`
         Get the king of a color
     `move(self, piece: Piece, pos: Position) -> None`
         Move a piece to a position
+    `promote(self, piece: Pawn, piece_type: Type[Piece]) -> Piece`
+        Promote a pawn on the board
+    `attackers_to(self, sq: int, color: Color) -> BitBoard`
+        Get the pieces of a color that attack a square
+    `attacked_squares(self, color: Color) -> BitBoard`
+        Get all the squares attacked by a color
     `is_attacked(self, pos: Position, color: Color) -> bool`
         Returns True if the position is attacked by a piece of the given color
+    `fen_bytes(self, out: bytearray) -> int`
+        Write the FEN of the board into a buffer
+    `record_position(self, position: bytes) -> None`
+        Add a position to the move history
     `undo(self) -> None`
         Undo the last move
     `redo(self) -> None`
@@ -74,15 +105,22 @@ class Board:
         Returns True if there is insuficient material on the board
     '''
 
-    matrix: List[List[Optional[Piece]]] = field(
-        init= False,
-        default_factory= lambda: [[None] * 8 for _ in range(8)]
-    )
+    squares: List[Optional[Piece]] = field(init= False, default_factory= lambda: [None] * 64)
     kings: dict[Color, King] = field(init= False, default_factory= dict)
     turn: str = field(init= False, default= 'w')
     en_passant: Optional[Position] = field(init= False, default= None)
     castling: str = field(kw_only= True, default= 'KQkq')
-    move_history: List[str] = field(init= False, default_factory= list)
+    move_history: List[bytes] = field(init= False, default_factory= list)
+    position_counts: Counter[bytes] = field(init= False, default_factory= Counter)
+    occupancy: list[BitBoard] = field(init= False, default_factory= lambda: [0, 0])
+    bitboards: dict[tuple[Color, Type[Piece]], BitBoard] = field(
+        init= False,
+        default_factory= lambda: {
+            (color, piece_type): 0
+            for color in Color
+            for piece_type in (Pawn, Knight, Bishop, Rook, Queen, King)
+        }
+    )
 
     @classmethod
     def from_fen(cls, fen: str, pieces_from_fen: dict[str, Type[Piece]]) -> Self:
@@ -129,7 +167,7 @@ class Board:
         fen_list = fen.split('/')
 
         i_row = 8
-        for row, fen_row in zip(self.matrix, fen_list):
+        for fen_row in fen_list:
             i_col = 0
 
             for char in fen_row:
@@ -139,9 +177,11 @@ class Board:
 
                 color = Color.WHITE if char.isupper() else Color.BLACK
 
-                piece = pieces_from_fen[char.lower()](color, Position(int_to_col(i_col), i_row))
+                piece = pieces_from_fen[char.lower()](color, Position(i_col, i_row))
 
-                row[i_col] = piece
+                self.squares[piece._sq] = piece
+                self.occupancy[color] |= 1 << piece._sq
+                self.bitboards[color, type(piece)] |= 1 << piece._sq
 
                 if isinstance(piece, King):
                     self.kings.update({piece.color: piece})
@@ -158,7 +198,7 @@ class Board:
         if config.small_board:
             return '\n'.join(
                 ' '.join(piece_repr(piece) if piece else '.' for piece in row)
-                for row in self.matrix
+                for row in self._ranks()
             ) + '\n'
 
         border: str = '  +---+---+---+---+---+---+---+---+\n'
@@ -168,7 +208,7 @@ class Board:
                 f'{8 - i} | ' + ' | '.join(
                     piece_repr(piece) if piece else ' ' for piece in row
                 ) + ' |\n'
-                for i, row in enumerate(self.matrix)
+                for i, row in enumerate(self._ranks())
             ) + border + rank_labels
 
     def __repr__(self) -> str:
@@ -177,42 +217,73 @@ class Board:
                 str(sum(1 for _ in group)) if piece is None else str(piece)
                 for piece, group in groupby(row)
             )
-            for row in self.matrix
+            for row in self._ranks()
         )
 
-    def __getitem__(self, pos: str | Position) -> Optional[Piece]:
+    def __getitem__(self, pos: int | str | Position) -> Optional[Piece]:
+        if isinstance(pos, int):
+            return self.squares[pos]
         if isinstance(pos, str):
             pos = Position(pos[0], int(pos[1]))
-        col, row = pos
-        return self.matrix[8 - row][col_to_int(col)]
+        return self.squares[pos.sq]
 
-    def __setitem__(self, pos: str | Position, piece: Optional[Piece]) -> None:
+    def __setitem__(self, pos: int | str | Position, piece: Optional[Piece]) -> None:
         if isinstance(pos, str):
             pos = Position(pos[0], int(pos[1]))
-        col, row = pos
-        self.matrix[8 - row][col_to_int(col)] = piece
+        sq = pos if isinstance(pos, int) else pos.sq
+        bit = 1 << sq
+
+        if (old_piece := self.squares[sq]) is not None:
+            self.occupancy[old_piece.color] &= ~bit
+            self.bitboards[old_piece.color, type(old_piece)] &= ~bit
+        if piece is not None:
+            self.occupancy[piece.color] |= bit
+            self.bitboards[piece.color, type(piece)] |= bit
 
-    def __delitem__(self, pos: str | Position) -> None:
+        self.squares[sq] = piece
+
+    def __delitem__(self, pos: int | str | Position) -> None:
         if isinstance(pos, str):
             pos = Position(pos[0], int(pos[1]))
-        col, row = pos
-        self.matrix[8 - row][col_to_int(col)] = None
+        sq = pos if isinstance(pos, int) else pos.sq
+
+        if (old_piece := self.squares[sq]) is not None:
+            bit = 1 << sq
+            self.occupancy[old_piece.color] &= ~bit
+            self.bitboards[old_piece.color, type(old_piece)] &= ~bit
+
+        self.squares[sq] = None
 
     def __iter__(self) -> Generator[Optional[Piece], None, None]:
-        for row in self.matrix:
-            for piece in row:
-                yield piece
+        for row in self._ranks():
+            yield from row
 
     def __contains__(self, piece: Piece) -> bool:
-        return piece in reduce(lambda pieces, row: pieces + row, self.matrix, [])
+        return piece in self.squares
 
     def __len__(self) -> int:
-        return sum(reduce(
-            lambda sum,
-            element: sum + 1,
-            filter(lambda p: p, pieces),
-            0
-        ) for pieces in self.matrix)
+        return self.occ.bit_count()
+
+    def _ranks(self) -> Generator[List[Optional[Piece]], None, None]:
+        '''
+        Yields the ranks of the board from the 8th to the 1st (the order of the FEN)
+        '''
+
+        for sq in range(56, -8, -8):
+            yield self.squares[sq:sq + 8]
+
+    @property
+    def occ(self) -> BitBoard:
+        '''
+        Get the bitboard of all the occupied squares
+
+        Returns
+        -------
+        `BitBoard`
+            Bitboard of the occupied squares
+        '''
+
+        return self.occupancy[Color.WHITE] | self.occupancy[Color.BLACK]
 
     @property
     def pieces(self) -> list[Piece]:
@@ -225,24 +296,49 @@ class Board:
             List of all pieces on the board
         '''
 
-        return reduce(lambda pieces, row: pieces + list(filter(None, row)), self.matrix, [])
+        return [piece for piece in self if piece is not None]
 
-    def is_valid(self, pos: Position) -> bool:
+    def pieces_of(self, color: Color) -> list[Piece]:
         '''
-        Check if a position is valid
+        Get the pieces of a color, walking its occupancy bitboard
 
         Parameters
         ----------
-        `pos: Position`
-            Position to check
-        
+        `color: Color`
+            Color of the pieces to get
+
         Returns
         -------
-        `bool`
-            True if the position is valid
+        `list[Piece]`
+            List of the pieces of the color
         '''
 
-        return 1 <= pos.row <= 8 and 1 <= col_to_int(pos.col) <= 8
+        pieces: list[Piece] = []
+        bb = self.occupancy[color]
+        while bb:
+            sq = (bb & -bb).bit_length() - 1
+            piece = self.squares[sq]
+            assert piece is not None
+            pieces.append(piece)
+            bb &= bb - 1
+        return pieces
+
+    def own_bb(self, color: Color) -> BitBoard:
+        '''
+        Get the bitboard of the squares occupied by a color
+
+        Parameters
+        ----------
+        `color: Color`
+            Color of the pieces
+
+        Returns
+        -------
+        `BitBoard`
+            Bitboard of the squares occupied by the color
+        '''
+
+        return self.occupancy[color]
 
     def get_king(self, color: Color) -> King:
         '''
@@ -283,8 +379,9 @@ class Board:
         '''
 
         if isinstance(piece, King) and abs(piece.pos.diff(pos)[0]) == 2:
-            rook = self[pos + (1, 0)] if pos.col == 'g' else self[pos - (2, 0)]
-            castle_pos = Position('f' if pos.col == 'g' else 'd', pos.row)
+            sq = pos.sq
+            rook = self[sq + 1] if pos.file == 6 else self[sq - 2]
+            castle_pos = SQUARES[sq - 1] if pos.file == 6 else SQUARES[sq + 1]
 
             if isinstance(rook, Rook) and rook.color == piece.color:
                 del self[piece.pos]
@@ -299,6 +396,96 @@ class Board:
             piece.move(pos)
             self[pos] = piece
 
+    def promote(self, piece: Pawn, piece_type: Type[Piece]) -> Piece:
+        '''
+        Promote a pawn on the board, replacing it with a new piece
+
+        Parameters
+        ----------
+        `piece: Pawn`
+            Pawn to promote
+        `piece_type: Type[Piece]`
+            Type of the piece to promote to
+
+        Returns
+        -------
+        `Piece`
+            The piece that replaced the pawn
+        '''
+
+        promoted = piece.promote(piece_type)
+        self[promoted.pos] = promoted
+        return promoted
+
+    def attackers_to(self, sq: int, color: Color) -> BitBoard:
+        '''
+        Get the pieces of a color that attack a square
+
+        Parameters
+        ----------
+        `sq: int`
+            Index of the square to check
+        `color: Color`
+            Color of the attackers
+
+        Returns
+        -------
+        `BitBoard`
+            Bitboard of the squares of the attackers
+        '''
+
+        bitboards = self.bitboards
+        occ = self.occ
+        queens = bitboards[color, Queen]
+        enemy_color = Color.BLACK if color == Color.WHITE else Color.WHITE
+
+        return (
+            (PAWN_ATTACKS[enemy_color][sq] & bitboards[color, Pawn]) |
+            (KNIGHT_ATTACKS[sq] & bitboards[color, Knight]) |
+            (KING_ATTACKS[sq] & bitboards[color, King]) |
+            (bishop_attacks(sq, occ) & (bitboards[color, Bishop] | queens)) |
+            (rook_attacks(sq, occ) & (bitboards[color, Rook] | queens))
+        )
+
+    def attacked_squares(self, color: Color) -> BitBoard:
+        '''
+        Get all the squares attacked by a color
+
+        Parameters
+        ----------
+        `color: Color`
+            Color of the attackers
+
+        Returns
+        -------
+        `BitBoard`
+            Bitboard of the attacked squares
+        '''
+
+        bitboards = self.bitboards
+        occ = self.occ
+        queens = bitboards[color, Queen]
+
+        attacked = (
+            pawn_attacks(bitboards[color, Pawn], color) |
+            knight_attacks(bitboards[color, Knight]) |
+            king_attacks(bitboards[color, King])
+        )
+
+        bb = bitboards[color, Bishop] | queens
+        while bb:
+            sq = (bb & -bb).bit_length() - 1
+            attacked |= bishop_attacks(sq, occ)
+            bb &= bb - 1
+
+        bb = bitboards[color, Rook] | queens
+        while bb:
+            sq = (bb & -bb).bit_length() - 1
+            attacked |= rook_attacks(sq, occ)
+            bb &= bb - 1
+
+        return attacked
+
     def is_attacked(self, pos: Position, color: Color) -> bool:
         '''
         Check if a position is attacked by a color
@@ -316,12 +503,59 @@ class Board:
             Whether the position is attacked by the color
         '''
 
-        for piece in self:
-            if piece and piece.color == color and (
-                piece.can_capture(pos) if isinstance(piece, Pawn) else piece.can_move(self, pos)
-            ):
-                return True
-        return False
+        return self.attackers_to(pos.sq, color) != 0
+
+    def fen_bytes(self, out: bytearray) -> int:
+        '''
+        Write the FEN of the board (the same as `repr`) into a buffer owned by the caller
+
+        Parameters
+        ----------
+        `out: bytearray`
+            Buffer to write into, it must have room for at least 71 bytes
+
+        Returns
+        -------
+        `int`
+            Number of bytes written
+        '''
+
+        i = 0
+        for i_row, row in enumerate(self._ranks()):
+            if i_row:
+                out[i] = 47 # '/'
+                i += 1
+
+            empty = 0
+            for piece in row:
+                if piece is None:
+                    empty += 1
+                    continue
+                if empty:
+                    out[i] = 48 + empty # digit
+                    i += 1
+                    empty = 0
+                out[i] = PIECE_TO_BYTE[type(piece), piece.color]
+                i += 1
+
+            if empty:
+                out[i] = 48 + empty
+                i += 1
+
+        return i
+
+    def record_position(self, position: bytes) -> None:
+        '''
+        Add a position to the move history
+
+        Parameters
+        ----------
+        `position: bytes`
+            Key of the position (board, turn, castling and en passant)
+        '''
+
+        self.move_history.append(position)
+        self.position_counts[position] += 1
 
     def undo(self) -> None: #! TODO: Implement
         '''
@@ -343,7 +577,7 @@ class Board:
             Whether the position has occured 3 times
         '''
 
-        return self.move_history.count(self.move_history[-1]) >= 3
+        return self.position_counts[self.move_history[-1]] >= 3
 
     def is_insufficient_material(self) -> bool:
         '''
@@ -32,7 +32,7 @@ class GameOver(Exception):
         self.game_over_status: GameOverStatus = game_over_status
         self.score: str
 
-        if winner:
+        if winner is not None:
             self.score = '1-0' if self.winner == Color.WHITE else '0-1'
         else:
             self.score = '1/2-1/2'
@@ -66,6 +66,8 @@ class Game(ABC):
         The fullmove number
     `pieces_from_fen: dict[str, Type[Piece]]`
         A dictionary that maps the FEN of a piece to the piece class
+    `_fen_buf: bytearray`
+        Buffer reused to write the FEN of the board when recording each position
     
     Operators
     ---------
@@ -112,6 +114,7 @@ class Game(ABC):
         init= False,
         default_factory= lambda: {'k': King}
     )
+    _fen_buf: bytearray = field(init= False, repr= False, default_factory= lambda: bytearray(80))
 
     def __post_init__(self) -> None:
         pass
@@ -183,7 +186,7 @@ class Game(ABC):
             self.board.en_passant = en_passant
 
     @property
-    def move_history(self) -> list[str]:
+    def move_history(self) -> list[bytes]:
         '''
         List of all the moves made
         '''
@@ -299,7 +302,7 @@ class Game(ABC):
                     piece = p
                     break
 
-            if isinstance(piece, Pawn) and pos == self.en_passant:
+            if isinstance(piece, Pawn) and pos == self.board.en_passant:
                 captured_piece = self[pos.col + ('5' if self.turn == 'w' else '4')]
             else:
                 captured_piece = self[str(pos)]
@@ -1,10 +1,13 @@
 '''./src/models/game_modes/standard.py'''
 
+from typing import Optional
+
 from ..game import Game, GameOver
 from ..board import Board
+from ..bitboard import PAWN_ATTACKS
 from ..piece import Piece
 from ..pieces.standard import Pawn, Knight, Bishop, Rook, Queen, King
-from ...helpers.constants import Position, COLOR_MAP, Color, GameOverStatus
+from ...helpers.constants import Position, SQUARES, COLOR_MAP, Color, GameOverStatus
 from ...helpers.custom_errors import InvalidMoveInputError, InvalidFenError
 
 
@@ -45,8 +48,6 @@ class StandardGame(Game):
         Redoes the last undone move
     `is_check(color: Color) -> bool`
         Returns whether is check or not
-    `is_legal(piece: Piece, pos: Position) -> bool`
-        Returns whether a move is legal or not
     `update_legal_moves() -> None`
         Updates the legal moves of all the pieces
     `move(move: str) -> None`
@@ -108,46 +109,47 @@ class StandardGame(Game):
         '''
 
         color = COLOR_MAP[self.turn]
-        self.change_turn()
-        enemy_color = COLOR_MAP[self.turn]
-
-        res: bool = False
-
-        res = self.board.is_attacked(self.board.get_king(color).pos, enemy_color)
+        enemy_color = Color.BLACK if color == Color.WHITE else Color.WHITE
 
-        self.change_turn()
-        
-        return res
+        return self.board.is_attacked(self.board.get_king(color).pos, enemy_color)
 
-    def is_legal(self, piece: Piece, pos: Position) -> bool:
+    def _is_safe(
+            self,
+            piece: Piece,
+            pos: Position,
+            enemy_color: Color,
+            king_pos: Optional[Position]
+    ) -> bool:
         '''
-        Returns whether a move is legal or not
+        Returns whether a move the piece can make leaves its king out of check
 
         Parameters
         ----------
         `piece: Piece`
             The piece to move
         `pos: Position`
-            The position to move to
+            The position to move to (one the piece can move to)
+        `enemy_color: Color`
+            The color of the player that is not moving
+        `king_pos: Optional[Position]`
+            The position of the king of the player moving (`None` if the piece is the king)
 
         Returns
         -------
         `bool`
-            Whether the move is legal or not
+            Whether the king is safe after the move
         '''
 
-        if not piece.can_move(self.board, pos):
-            return False
-        
-        piece_captured = self.board[pos]
+        board = self.board
+        piece_captured = board[pos]
         previous_pos = piece.pos
 
-        self.board.move(piece, pos)
+        board.move(piece, pos)
 
-        res = not self.is_check()
+        res = not board.is_attacked(pos if king_pos is None else king_pos, enemy_color)
 
-        self.board.move(piece, previous_pos)
-        self.board[pos] = piece_captured
+        board.move(piece, previous_pos)
+        board[pos] = piece_captured
 
         return res
 
@@ -156,21 +158,22 @@ class StandardGame(Game):
         Updates the legal moves of all the pieces
         '''
 
-        for p in self.board.pieces:
-            tmp_pos = Position('a', 1)
-            if p.color != COLOR_MAP[self.turn]:
-                continue
+        color = COLOR_MAP[self.turn]
+        enemy_color = Color.BLACK if color == Color.WHITE else Color.WHITE
+        king = self.board.get_king(color)
+        king_pos = king.pos
+
+        for p in self.board.pieces_of(color):
+            p_king_pos = None if p is king else king_pos
+            legal_moves_bb = pseudo_moves = p.pseudo_moves(self.board)
 
-            p.legal_moves.clear()
+            while pseudo_moves:
+                bit = pseudo_moves & -pseudo_moves
+                if not self._is_safe(p, SQUARES[bit.bit_length() - 1], enemy_color, p_king_pos):
+                    legal_moves_bb ^= bit
+                pseudo_moves ^= bit
 
-            for _ in range(64):
-                if self.is_legal(p, tmp_pos):
-                    p.legal_moves.append(tmp_pos)
-                
-                try:
-                    tmp_pos = next(tmp_pos)
-                except StopIteration:
-                    break
+            p.legal_moves_bb = legal_moves_bb
 
     def move(self, move: str) -> None:
         '''
@@ -199,18 +202,19 @@ class StandardGame(Game):
         match piece:
             case Pawn():
                 self.halfmove_clock = 0
-                chr_p = 'P' if piece.color == Color.BLACK else 'p' # pawn of enemy color
+                enemy_color = Color.BLACK if piece.color == Color.WHITE else Color.WHITE
+                skipped_sq = (pos.sq + previous_pos.sq) >> 1
 
+                # only an enemy pawn next to the destination can take en passant
                 if abs(pos.row - previous_pos.row) == 2 and (
-                    str(self.board[pos + (1, 0)]) == chr_p or str(self.board[pos + (-1, 0)]) == chr_p
+                    PAWN_ATTACKS[piece.color][skipped_sq] & self.board.bitboards[enemy_color, Pawn]
                 ):
-                    self.en_passant = pos + (0, -1) if piece.color == Color.WHITE else pos + (0, 1)
+                    self.en_passant = SQUARES[skipped_sq]
                     en_passant_changed = True
                 
                 elif pos.row == 1 or pos.row == 8:
                     if not promotion_type:
                         raise InvalidMoveInputError('Promotion type not specified')
-                    piece.promote(promotion_type)
                     
                 elif str(pos) == self.en_passant:
                     if not piece_captured:
@@ -241,6 +245,9 @@ class StandardGame(Game):
             self.en_passant = None
         
         self.board.move(piece, pos)
+
+        if promotion_type:
+            self.board.promote(piece, promotion_type)
         
         if piece_captured:
             self.halfmove_clock = 0
@@ -254,7 +261,10 @@ class StandardGame(Game):
         
         self.update_legal_moves()
 
-        self.move_history.append(repr(self.board) + self.turn + self.castling + self.en_passant)
+        n = self.board.fen_bytes(self._fen_buf)
+        self.board.record_position(
+            bytes(self._fen_buf[:n]) + (self.turn + self.castling + self.en_passant).encode()
+        )
 
         self.game_over() # check if the game is over
 
@@ -3,12 +3,11 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
-from typing import Optional, Protocol
+from typing import Optional, Protocol, Generator, ClassVar
 
 from ..helpers import Color, Position
 
 
-@dataclass(slots= True)
 class IBoard(Protocol):
     '''
     Board interface
@@ -17,29 +16,34 @@ class IBoard(Protocol):
     ----------
     `en_passant: Optional[Position]`
         The position of the en passant square
+    `occ: int`
+        The bitboard of the occupied squares
     
     Operators
     ---------
-    `__getitem__(pos: str | Position) -> Optional[Piece]`
-        Returns the piece at the given position.
+    `__getitem__(pos: int | str | Position) -> Optional[Piece]`
+        Returns the piece at the given position (or square index).
     
     Methods
     -------
-    `is_valid(pos: Position) -> bool`
-        Returns True if the position is valid.
-    `is_attacked(pos: Position, color: Color) -> bool`
-        Returns True if the position is attacked by a piece of the given color.
+    `own_bb(color: Color) -> int`
+        Returns the bitboard of the squares occupied by the given color.
+    `attacked_squares(color: Color) -> int`
+        Returns the bitboard of the squares attacked by the given color.
     '''
 
-    en_passant: Optional[Position] = field(init= False)
+    en_passant: Optional[Position]
 
-    def __getitem__(self, pos: str | Position) -> Optional[Piece]:...
+    @property
+    def occ(self) -> int:...
 
-    def is_valid(self, pos: Position) -> bool:...
+    def __getitem__(self, pos: int | str | Position) -> Optional[Piece]:...
 
-    def is_attacked(self, pos: Position, color: Color) -> bool:...
+    def own_bb(self, color: Color) -> int:...
 
-@dataclass(slots= True)
+    def attacked_squares(self, color: Color) -> int:...
+
+@dataclass(slots= True, eq= False)
 class Piece(ABC):
     '''
     Abstract piece class
@@ -50,8 +54,12 @@ class Piece(ABC):
         The color of the piece
     `pos: Position`
         The position of the piece
-    `legal_moves: list[Position]`
-        The legal moves of the piece
+    `legal_moves_bb: int`
+        Bitboard of the legal moves of the piece (bit `sq` set if the move is legal)
+    `legal_moves: Generator[Position, None, None]`
+        The legal moves of the piece (read from `legal_moves_bb`)
+    `_sq: int`
+        Index of the square of the piece (0 for a1, 63 for h8)
     
     Operators
     ---------
@@ -64,20 +72,35 @@ class Piece(ABC):
         Returns True if the move is legal.
     `move(pos: Position) -> None`
         Moves the piece to the given position.
-    `can_move(board: Board, pos: Position) -> bool`
-        Returns True if the piece can move to the given position (not taking into account
-        if the move is legal).
+    `pseudo_moves(board: Board) -> int`
+        Returns the bitboard of the squares the piece can move to (not taking into account
+        if the moves are legal).
     '''
 
     color: Color
     pos: Position
-    legal_moves: list[Position] = field(init= False, default_factory= list)
+    legal_moves_bb: int = field(init= False, default= 0)
+    _sq: int = field(init= False, repr= False) # index of `pos`, kept in sync by `move`
+
+    SYMBOLS: ClassVar[tuple[str, str]] = ('?', '?') # FEN letters indexed by color
+
+    def __post_init__(self) -> None:
+        self._sq = self.pos.sq
 
     def __str__(self) -> str:
-        if self.color == Color.WHITE:
-            return self.__class__.__name__[0].upper()
-        # else:
-        return self.__class__.__name__[0].lower()
+        return self.SYMBOLS[self.color]
+
+    @property
+    def legal_moves(self) -> Generator[Position, None, None]:
+        '''
+        The legal moves of the piece, only produced when they need to be enumerated.
+        '''
+
+        bb = self.legal_moves_bb
+        while bb:
+            lsb = bb & -bb
+            yield Position.from_sq(lsb.bit_length() - 1)
+            bb ^= lsb
 
     def is_legal_move(self, pos: str | Position) -> bool:
         '''
@@ -96,7 +119,7 @@ class Piece(ABC):
 
         if isinstance(pos, str) and pos[1].isdigit():
             pos = Position(pos[0], int(pos[1]))
-        return pos in self.legal_moves
+        return bool(self.legal_moves_bb & (1 << pos.sq))
 
     def move(self, pos: Position) -> None:
         '''
@@ -109,26 +132,21 @@ class Piece(ABC):
         '''
 
         self.pos = pos
+        self._sq = pos.sq
 
     @abstractmethod
-    def can_move(self, board: IBoard, pos: Position) -> bool:
+    def pseudo_moves(self, board: IBoard) -> int:
         '''
-        Returns True if the piece can move to the given position.
-        
+        Returns the squares the piece can move to.
+
         Parameters
         ----------
         `board: Board`
             The board to check
-        `pos: Position`
-            The position to check
 
         Returns
         -------
-        `bool`
-            True if the piece can move to the given position (not taking into account
-            if the move is legal)
+        `int`
+            Bitboard of the squares the piece can move to (not taking into account if the
+            moves are legal)
         '''
-
-        if self.pos == pos:
-            return False
-        return True
@@ -4,11 +4,12 @@ from dataclasses import dataclass
 from typing import Type, Optional
 
 from ..piece import Piece, IBoard
-from ...helpers.constants import Color, Position
-from ...helpers.functions import col_to_int
+from ..bitboard import KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, PAWN_QUIET, PAWN_DOUBLE, rank_span
+from ..sliders import bishop_attacks, rook_attacks, queen_attacks
+from ...helpers.constants import Color, Position, SQUARES
 
 
-@dataclass(slots= True)
+@dataclass(slots= True, eq= False)
 class Pawn(Piece):
     '''
     Pawn piece
@@ -19,8 +20,8 @@ class Pawn(Piece):
         The position of the piece on the board
     `color: Color`
         The color of the piece
-    `legal_moves: list[Position]`
-        The legal moves of the piece
+    `legal_moves_bb: int`
+        Bitboard of the legal moves of the piece
 
     Operators
     ---------
@@ -29,51 +30,37 @@ class Pawn(Piece):
 
     Methods
     -------
-    `can_move(board: Board, pos: Position) -> bool`
-        Returns True if the piece can move to the given position (not taking into account
-        if the move is legal).
-    `can_capture(pos: Position) -> bool`
-        Returns True if the piece can capture the piece at the given position.
+    `pseudo_moves(board: Board) -> int`
+        Returns the bitboard of the squares the piece can move to (not taking into account
+        if the moves are legal).
     `move(pos: Position) -> None`
         Moves the piece to the given position.
-    `promote(piece_type: Type[Piece]) -> None`
-        Promotes the pawn to the given piece type.
+    `promote(piece_type: Type[Piece]) -> Piece`
+        Returns the piece of the given type the pawn promotes to.
     '''
 
-    def can_move(self, board: IBoard, pos: Position) -> bool:
-        super(Pawn, self).can_move(board, pos)
-        sqr = board[pos]
+    SYMBOLS = ('P', 'p')
 
-        if sqr is not None:
-            return self.can_capture(pos)
+    def pseudo_moves(self, board: IBoard) -> int:
+        sq = self._sq
+        occ = board.occ
+        attacks = PAWN_ATTACKS[self.color][sq]
+        moves = attacks & occ & ~board.own_bb(self.color)
 
-        if self.color == Color.WHITE:
-            if board.en_passant == pos:
-                return self.pos + (1, 1) == pos or self.pos + (-1, 1) == pos
+        if board.en_passant is not None:
+            moves |= attacks & (1 << board.en_passant.sq)
 
-            return self.pos + (0, 1) == pos or (
-                self.pos + (0, 2) == pos and self.pos.row == 2 and board[self.pos + (0, 1)] is None
-            )
+        if quiet := PAWN_QUIET[self.color][sq] & ~occ:
+            moves |= quiet | (PAWN_DOUBLE[self.color][sq] & ~occ)
 
-        if board.en_passant == pos:
-            return self.pos + (1, -1) == pos or self.pos + (-1, -1) == pos
+        return moves
 
-        return self.pos + (0, -1) == pos or (
-            self.pos + (0, -2) == pos and self.pos.row == 7 and board[self.pos + (0, -1)] is None
-        )
-
-    def can_capture(self, pos: Position) -> bool:
-        if self.color == Color.WHITE:
-            return self.pos + (1, 1) == pos or self.pos + (-1, 1) == pos
-        # else:
-        return self.pos + (1, -1) == pos or self.pos + (-1, -1) == pos
-
-    def promote(self, piece_type: Type[Piece]) -> None:
+    def promote(self, piece_type: Type[Piece]) -> Piece:
         assert piece_type in [Knight, Bishop, Rook, Queen]
-        self.__class__ = piece_type
+        return piece_type(self.color, self.pos)
 
 
-@dataclass(slots= True)
+@dataclass(slots= True, eq= False)
 class Knight(Piece):
     '''
     Knight piece
@@ -84,8 +71,8 @@ class Knight(Piece):
         The position of the piece on the board
     `color: Color`
         The color of the piece
-    `legal_moves: list[Position]`
-        The legal moves of the piece
+    `legal_moves_bb: int`
+        Bitboard of the legal moves of the piece
 
     Operators
     ---------
@@ -94,37 +81,20 @@ class Knight(Piece):
 
     Methods
     -------
-    `can_move(board: Board, pos: Position) -> bool`
-        Returns True if the piece can move to the given position (not taking into account
-        if the move is legal).
+    `pseudo_moves(board: Board) -> int`
+        Returns the bitboard of the squares the piece can move to (not taking into account
+        if the moves are legal).
     `move(pos: Position) -> None`
         Moves the piece to the given position.
     '''
 
-    def __str__(self) -> str:
-        return 'N' if self.color == Color.WHITE else 'n'
-
-    def can_move(self, board: IBoard, pos: Position) -> bool:
-        super(Knight, self).can_move(board, pos)
-
-        x, y = self.pos
-        new_x, new_y = pos
+    SYMBOLS = ('N', 'n')
 
-        x = col_to_int(x)
-        new_x = col_to_int(new_x)
+    def pseudo_moves(self, board: IBoard) -> int:
+        return KNIGHT_ATTACKS[self._sq] & ~board.own_bb(self.color)
 
-        sqr = board[pos]
 
-        if (new_x, new_y) in [(x + 1, y + 2), (x + 2, y + 1), (x + 2, y - 1), (x + 1, y - 2),
-                              (x - 1, y - 2), (x - 2, y - 1), (x - 2, y + 1), (x - 1, y + 2)]:
-            return super(Knight, self).can_move(board, pos) and (
-                    sqr is None or sqr.color != self.color
-                )
-
-        return False
-
-
-@dataclass(slots= True)
+@dataclass(slots= True, eq= False)
 class Bishop(Piece):
     '''
     Bishop piece
@@ -135,8 +105,8 @@ class Bishop(Piece):
         The position of the piece on the board
     `color: Color`
         The color of the piece
-    `legal_moves: list[Position]`
-        The legal moves of the piece
+    `legal_moves_bb: int`
+        Bitboard of the legal moves of the piece
 
     Operators
     ---------
@@ -145,38 +115,20 @@ class Bishop(Piece):
 
     Methods
     -------
-    `can_move(board: Board, pos: Position) -> bool`
-        Returns True if the piece can move to the given position (not taking into account
-        if the move is legal).
+    `pseudo_moves(board: Board) -> int`
+        Returns the bitboard of the squares the piece can move to (not taking into account
+        if the moves are legal).
     `move(pos: Position) -> None`
         Moves the piece to the given position.
-    `check_path(board: Board, pos: Position) -> bool`
-        Returns True if the path to the given position is clear.
     '''
 
-    def can_move(self, board: IBoard, pos: Position) -> bool:
-        super(Bishop, self).can_move(board, pos)
-        x, y = pos.diff(self.pos)
-
-        return super(Bishop, self).can_move(board, pos) and abs(x) == abs(y) and self.check_path(board, pos)
+    SYMBOLS = ('B', 'b')
 
-    def check_path(self, board: IBoard, pos: Position) -> bool:
-        x, y = pos.diff(self.pos)
+    def pseudo_moves(self, board: IBoard) -> int:
+        return bishop_attacks(self._sq, board.occ) & ~board.own_bb(self.color)
 
-        step_x = 1 if x > 0 else -1
-        step_y = 1 if y > 0 else -1
 
-        for i in range(1, abs(x)):
-            if board[self.pos + (i * step_x, i * step_y)] is not None:
-                return False
-
-        sqr = board[pos]
-
-        return sqr is None or sqr.color != self.color
-
-
-
-@dataclass(slots= True)
+@dataclass(slots= True, eq= False)
 class Rook(Piece):
     '''
     Rook piece
@@ -187,8 +139,8 @@ class Rook(Piece):
         The position of the piece on the board
     `color: Color`
         The color of the piece
-    `legal_moves: list[Position]`
-        The legal moves of the piece
+    `legal_moves_bb: int`
+        Bitboard of the legal moves of the piece
 
     Operators
     ---------
@@ -197,43 +149,20 @@ class Rook(Piece):
     
     Methods
     -------
-    `can_move(board: Board, pos: Position) -> bool`
-        Returns True if the piece can move to the given position (not taking into account
-        if the move is legal).
+    `pseudo_moves(board: Board) -> int`
+        Returns the bitboard of the squares the piece can move to (not taking into account
+        if the moves are legal).
     `move(pos: Position) -> None`
         Moves the piece to the given position.
-    `check_path(board: Board, pos: Position) -> bool`
-        Returns True if the path to the given position is clear.
     '''
 
-    def can_move(self, board: IBoard, pos: Position) -> bool:
-        super(Rook, self).can_move(board, pos)
-
-        x, y = pos.diff(self.pos)
-
-        return super(Rook, self).can_move(board, pos) and (
-                x == 0 or y == 0
-            ) and self.check_path(board, pos)
-
-    def check_path(self, board: IBoard, pos: Position) -> bool:
-        x, y = pos.diff(self.pos)
+    SYMBOLS = ('R', 'r')
 
-        step_x = 1 if x > 0 else (-1 if x < 0 else 0)
-        step_y = 1 if y > 0 else (-1 if y < 0 else 0)
+    def pseudo_moves(self, board: IBoard) -> int:
+        return rook_attacks(self._sq, board.occ) & ~board.own_bb(self.color)
 
-        for i in range(1, abs(x)):
-            if board[self.pos + (i * step_x, i * step_y)] is not None:
-                return False
-        for i in range(1, abs(y)):
-            if board[self.pos + (i * step_x, i * step_y)] is not None:
-                return False
 
-        sqr = board[pos]
-
-        return sqr is None or sqr.color != self.color
-
-
-@dataclass(slots= True)
+@dataclass(slots= True, eq= False)
 class Queen(Piece):
     '''
     Queen piece
@@ -244,8 +173,8 @@ class Queen(Piece):
         The position of the piece on the board
     `color: Color`
         The color of the piece
-    `legal_moves: list[Position]`
-        The legal moves of the piece
+    `legal_moves_bb: int`
+        Bitboard of the legal moves of the piece
     
     Operators
     ---------
@@ -254,43 +183,20 @@ class Queen(Piece):
     
     Methods
     -------
-    `can_move(board: Board, pos: Position) -> bool`
-        Returns True if the piece can move to the given position (not taking into account
-        if the move is legal).
+    `pseudo_moves(board: Board) -> int`
+        Returns the bitboard of the squares the piece can move to (not taking into account
+        if the moves are legal).
     `move(pos: Position) -> None`
         Moves the piece to the given position.
-    `check_path(board: Board, pos: Position) -> bool`
-        Returns True if the path to the given position is clear.
     '''
 
-    def can_move(self, board: IBoard, pos: Position) -> bool:
-        super(Queen, self).can_move(board, pos)
-
-        x, y = pos.diff(self.pos)
-
-        return super(Queen, self).can_move(board, pos) and (
-                x == 0 or y == 0 or abs(x) == abs(y)
-            ) and self.check_path(board, pos)
-
-    def check_path(self, board: IBoard, pos: Position) -> bool:
-        x, y = pos.diff(self.pos)
-
-        step_x = 1 if x > 0 else (-1 if x < 0 else 0)
-        step_y = 1 if y > 0 else (-1 if y < 0 else 0)
-
-        for i in range(1, abs(x)):
-            if board[self.pos + (i * step_x, i * step_y)] is not None:
-                return False
-        for i in range(1, abs(y)):
-            if board[self.pos + (i * step_x, i * step_y)] is not None:
-                return False
+    SYMBOLS = ('Q', 'q')
 
-        sqr = board[pos]
+    def pseudo_moves(self, board: IBoard) -> int:
+        return queen_attacks(self._sq, board.occ) & ~board.own_bb(self.color)
 
-        return sqr is None or sqr.color != self.color
 
-
-@dataclass(slots= True)
+@dataclass(slots= True, eq= False)
 class King(Piece):
     '''
     King piece
@@ -301,8 +207,8 @@ class King(Piece):
         The position of the piece on the board
     `color: Color`
         The color of the piece
-    `legal_moves: list[Position]`
-        The legal moves of the piece
+    `legal_moves_bb: int`
+        Bitboard of the legal moves of the piece
     
     Operators
     ---------
@@ -311,9 +217,9 @@ class King(Piece):
     
     Methods
     -------
-    `can_move(board: Board, pos: Position) -> bool`
-        Returns True if the piece can move to the given position (not taking into account
-        if the move is legal).
+    `pseudo_moves(board: Board) -> int`
+        Returns the bitboard of the squares the piece can move to (not taking into account
+        if the moves are legal).
     `move(pos: Position) -> None`
         Moves the piece to the given position.
     `can_castle(board: Board, castle_type: str) -> bool`
@@ -326,14 +232,10 @@ class King(Piece):
         Castles the king in the given direction.
     '''
 
-    def can_move(self, board: IBoard, pos: Position) -> bool:
-        x, y = pos.diff(self.pos)
-
-        sqr = board[pos]
+    SYMBOLS = ('K', 'k')
 
-        return super(King, self).can_move(board, pos) and (
-                abs(x) <= 1 and abs(y) <= 1 and (sqr is None or sqr.color != self.color)
-            )
+    def pseudo_moves(self, board: IBoard) -> int:
+        return KING_ATTACKS[self._sq] & ~board.own_bb(self.color)
 
     def can_castle(self, board: IBoard, castle_type: str) -> bool:
 
@@ -345,15 +247,16 @@ class King(Piece):
         return self.check_castle_paths(rook, board, castle_type)
 
     def get_rook(self, board: IBoard, castle_type: str) -> Optional[Rook]:
-        pos_tmp = self.pos
+        sq = self._sq
 
-        step = (1, 0) if castle_type == 'O-O' else (-1, 0)
+        step, end = (1, sq | 7) if castle_type == 'O-O' else (-1, sq & ~7)
 
-        while board.is_valid(pos_tmp):
-            pos_tmp = pos_tmp + step
-            piece = board[pos_tmp]
+        while sq != end:
+            sq += step
+            piece = board[sq]
             if isinstance(piece, Rook):
-                return piece
+                return piece if piece.color == self.color else None
+        return None
 
     def check_castle_paths(self, rook: Rook, board: IBoard, castle_type: str) -> bool:
 
@@ -364,38 +267,23 @@ class King(Piece):
             end_pos_k = Position('c', self.pos.row)
             end_pos_r = end_pos_k + (1, 0)
 
-        step_k = (1, 0) if end_pos_k.col > self.pos.col else (-1, 0) if end_pos_k.col < self.pos.col else (0, 0)
-        step_r = (1, 0) if end_pos_r.col > rook.pos.col else (-1, 0) if end_pos_r.col < rook.pos.col else (0, 0)
+        king_bit = 1 << self._sq
+        rook_bit = 1 << rook._sq
 
-        pos_tmp_k = self.pos
-        pos_tmp_r = rook.pos
-
-        enemy_color = Color.WHITE if self.color == Color.BLACK else Color.BLACK
+        king_path = rank_span(self._sq, end_pos_k.sq) & ~king_bit
+        between = (king_path | rank_span(rook._sq, end_pos_r.sq)) & ~(king_bit | rook_bit)
 
-        while pos_tmp_k != end_pos_k and board.is_valid(pos_tmp_k):
-            pos_tmp_k = pos_tmp_k + step_k
-            if (board[pos_tmp_k] is not None and not isinstance(board[pos_tmp_k], Rook)
-                ) or board.is_attacked(pos_tmp_k, enemy_color):
-                return False
+        if board.occ & between:
+            return False
 
-        while pos_tmp_r != end_pos_r and board.is_valid(pos_tmp_r):
-            pos_tmp_r = pos_tmp_r + step_r
-            if board[pos_tmp_r] is not None and not isinstance(board[pos_tmp_r], King):
-                print('2')
-                return False
+        enemy_color = Color.WHITE if self.color == Color.BLACK else Color.BLACK
 
-        return True
+        return not board.attacked_squares(enemy_color) & king_path
 
     def castle(self, rook: Rook) -> None:
-        x = self.pos.col
-        rook_x = rook.pos.col
-
-        x = col_to_int(x)
-        rook_x = col_to_int(rook_x)
-
-        if rook_x < x:
-            self.move(self.pos - (2, 0))
-            rook.move(self.pos + (1, 0))
+        if rook._sq < self._sq:
+            self.move(SQUARES[self._sq - 2])
+            rook.move(SQUARES[self._sq + 1])
         else:
-            self.move(self.pos + (2, 0))
-            rook.move(self.pos - (1, 0))
+            self.move(SQUARES[self._sq + 2])
+            rook.move(SQUARES[self._sq - 1])
@@ -0,0 +1,176 @@
+'''./src/models/sliders.py'''
+
+from typing import Optional
+
+from .bitboard import BitBoard, FULL
+from ._magics import ROOK_MAGICS, BISHOP_MAGICS
+
+
+_BYTE_REV: bytes = bytes(int(f'{byte:08b}'[::-1], 2) for byte in range(256))
+
+
+def bit_reverse64(bb: BitBoard) -> BitBoard:
+    '''
+    Reverses the order of the 64 bits of a bitboard (a1 <-> h8).
+
+    Parameters
+    ----------
+    `bb: BitBoard`
+        The bitboard to reverse
+
+    Returns
+    -------
+    `BitBoard`
+        The reversed bitboard
+    '''
+
+    return int.from_bytes(bb.to_bytes(8, 'little').translate(_BYTE_REV), 'big')
+
+def _line_mask(sq: int, step_x: int, step_y: int) -> BitBoard:
+    '''
+    Returns the squares of the line that goes through a square in the given direction and
+    its opposite (the square itself is not included).
+    '''
+
+    mask = 0
+    for sign in (1, -1):
+        x, y = sq & 7, sq >> 3
+        while True:
+            x, y = x + sign * step_x, y + sign * step_y
+            if not (0 <= x < 8 and 0 <= y < 8):
+                break
+            mask |= 1 << (x + 8 * y)
+    return mask
+
+
+RANK_MASK: list[BitBoard] = [_line_mask(sq, 1, 0) for sq in range(64)]
+
+FILE_MASK: list[BitBoard] = [_line_mask(sq, 0, 1) for sq in range(64)]
+
+DIAG_MASK: list[BitBoard] = [_line_mask(sq, 1, 1) for sq in range(64)]
+
+ANTIDIAG_MASK: list[BitBoard] = [_line_mask(sq, 1, -1) for sq in range(64)]
+
+
+def _line_attacks(sq: int, occ: BitBoard, mask: BitBoard) -> BitBoard:
+    '''
+    Hyperbola Quintessence: returns the squares attacked along one line (stopping at the
+    first blocker in each direction, blockers included).
+    '''
+
+    slider = 1 << sq
+    o = occ & mask
+    forward = (o - slider) & FULL
+    reverse = (bit_reverse64(o) - bit_reverse64(slider)) & FULL
+    return (forward ^ bit_reverse64(reverse)) & mask
+
+_EDGE_FILES: BitBoard = 0x8181818181818181
+_EDGE_RANKS: BitBoard = 0xFF000000000000FF
+
+ROOK_RELEVANT: list[BitBoard] = [
+    (RANK_MASK[sq] & ~_EDGE_FILES) | (FILE_MASK[sq] & ~_EDGE_RANKS) for sq in range(64)
+]
+
+BISHOP_RELEVANT: list[BitBoard] = [
+    (DIAG_MASK[sq] | ANTIDIAG_MASK[sq]) & ~(_EDGE_FILES | _EDGE_RANKS) for sq in range(64)
+]
+
+ROOK_SHIFT: list[int] = [64 - mask.bit_count() for mask in ROOK_RELEVANT]
+
+BISHOP_SHIFT: list[int] = [64 - mask.bit_count() for mask in BISHOP_RELEVANT]
+
+# attack tables indexed by magic, each one is filled the first time its square is queried
+_ROOK_TABLES: list[Optional[list[BitBoard]]] = [None] * 64
+_BISHOP_TABLES: list[Optional[list[BitBoard]]] = [None] * 64
+
+
+def _build_table(
+        sq: int,
+        relevant: BitBoard,
+        magic: int,
+        shift: int,
+        masks: tuple[BitBoard, BitBoard]
+) -> list[BitBoard]:
+    '''
+    Returns the magic indexed attack table of a square, computing the attacks of every
+    subset of its relevant occupancy with Hyperbola Quintessence.
+    '''
+
+    table = [0] * (1 << (64 - shift))
+    occ = 0
+    while True:
+        table[((occ * magic) & FULL) >> shift] = (
+            _line_attacks(sq, occ, masks[0]) | _line_attacks(sq, occ, masks[1])
+        )
+        occ = (occ - relevant) & relevant # next subset (Carry-Rippler)
+        if not occ:
+            return table
+
+def bishop_attacks(sq: int, occ: BitBoard) -> BitBoard:
+    '''
+    Returns the squares attacked by a bishop.
+
+    Parameters
+    ----------
+    `sq: int`
+        The square of the bishop
+    `occ: BitBoard`
+        The occupied squares of the board
+
+    Returns
+    -------
+    `BitBoard`
+        The attacked squares
+    '''
+
+    table = _BISHOP_TABLES[sq]
+    if table is None:
+        table = _BISHOP_TABLES[sq] = _build_table(
+            sq, BISHOP_RELEVANT[sq], BISHOP_MAGICS[sq], BISHOP_SHIFT[sq],
+            (DIAG_MASK[sq], ANTIDIAG_MASK[sq])
+        )
+    return table[(((occ & BISHOP_RELEVANT[sq]) * BISHOP_MAGICS[sq]) & FULL) >> BISHOP_SHIFT[sq]]
+
+def rook_attacks(sq: int, occ: BitBoard) -> BitBoard:
+    '''
+    Returns the squares attacked by a rook.
+
+    Parameters
+    ----------
+    `sq: int`
+        The square of the rook
+    `occ: BitBoard`
+        The occupied squares of the board
+
+    Returns
+    -------
+    `BitBoard`
+        The attacked squares
+    '''
+
+    table = _ROOK_TABLES[sq]
+    if table is None:
+        table = _ROOK_TABLES[sq] = _build_table(
+            sq, ROOK_RELEVANT[sq], ROOK_MAGICS[sq], ROOK_SHIFT[sq],
+            (RANK_MASK[sq], FILE_MASK[sq])
+        )
+    return table[(((occ & ROOK_RELEVANT[sq]) * ROOK_MAGICS[sq]) & FULL) >> ROOK_SHIFT[sq]]
+
+def queen_attacks(sq: int, occ: BitBoard) -> BitBoard:
+    '''
+    Returns the squares attacked by a queen.
+
+    Parameters
+    ----------
+    `sq: int`
+        The square of the queen
+    `occ: BitBoard`
+        The occupied squares of the board
+
+    Returns
+    -------
+    `BitBoard`
+        The attacked squares
+    '''
+
+    return bishop_attacks(sq, occ) | rook_attacks(sq, occ)
@@ -1,11 +1,56 @@
 '''./src/system.py'''
 
-from dataclasses import dataclass, field
-from typing import Callable, Optional
+from __future__ import annotations
+import sys
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Optional, TYPE_CHECKING
 
 from .helpers import console, config, IllegalMoveError, InvalidMoveInputError, InvalidFenError
-from .models.game import Game, GameOver
-from .models.game_modes import StandardGame, Chess960Game
+
+if TYPE_CHECKING: # the models are only imported once a game is started
+    from .models.game import Game
+
+
+COMMANDS: tuple[str, ...] = ('play', 'help', 'options', 'exit')
+
+_HELP_MSG: str = (
+    '    Commands: \n'
+    '\tplay - start a new game\n'
+    '\thelp - show this message\n'
+    '\toptions - customize your board\n'
+    '\texit - exit the program\n'
+)
+
+_EXIT_MSG: str = 'Exiting...\n'
+
+
+def _standard_game() -> Game:
+    from .models.game_modes.standard import StandardGame
+    return StandardGame()
+
+def _chess960_game() -> Game:
+    from .models.game_modes.chess960 import Chess960Game
+    return Chess960Game()
+
+
+# game modes of the selection menu and the function that creates each one
+_MODE_FACTORIES: dict[str, Callable[[], Game]] = {
+    'Standard Chess': _standard_game,
+    'Chess960': _chess960_game,
+}
+
+_GAME_MODE_CHOICES: list[str] = list(_MODE_FACTORIES)
+
+# options of the play menu, the keys of the handlers in `play_game`. The handlers are
+# looked up with `dict.get`, which compares the strings by hash and equality (the fast
+# prompt returns these same objects, the questionary fallback returns equal copies)
+_MOVE = sys.intern('move')
+_UNDO = sys.intern('<--')
+_REDO = sys.intern('-->')
+_EXIT = sys.intern('exit')
+
+_PLAY_CHOICES: list[str] = [_MOVE, _UNDO, _REDO, _EXIT]
 
 
 @dataclass(slots= True)
@@ -13,39 +58,16 @@ class System:
     '''
     A class that represents the system of the program.
 
-    Attributes
-    ----------
-    `commands : dict[str, Callable[[], None]]`
-        A dictionary of commands that the user can execute.
-    
     Methods
     -------
     `menu() -> None`
         Displays the menu and executes the user's commands.
-    `execute(command: str) -> None`
-        Executes the given command.
+    `execute(command: str) -> bool`
+        Executes the given command, returns False if it exits the program.
     `select_game_mode() -> None`
         Displays the game mode selection menu and starts the game.
     '''
 
-    commands: dict[str, Callable[[], None]] = field(kw_only= True, default_factory= dict)
-
-    def __post_init__(self):
-
-        self.commands['play'] = self.select_game_mode
-
-        self.commands['help'] = lambda: print(
-            '    Commands: \n'
-            '\tplay - start a new game\n'
-            '\thelp - show this message\n'
-            '\toptions - customize your board\n'
-            '\texit - exit the program\n'
-        )
-
-        self.commands['options'] = self.options
-
-        self.commands['exit'] = lambda: print('Exiting...\n')
-
     def menu(self) -> None:
         '''
         Displays the menu and executes the user's commands.
@@ -53,24 +75,22 @@ class System:
         Raises
         ------
         `AssertionError`
-            If the user's command is not in the `commands` dictionary.
+            If the user's command is not one of `COMMANDS`.
         '''
 
         console.clear()
 
-        res: str = ''
+        running = True
 
-        while res != 'exit':
+        while running:
 
-            keys: list[str] = list(self.commands.keys())
-
-            res = console.get_list_input('Select an option', keys)
+            res = console.get_list_input_fast('Select an option', COMMANDS)
 
             console.clear()
 
-            self.execute(res)
+            running = self.execute(res)
 
-    def execute(self, command: str) -> None:
+    def execute(self, command: str) -> bool:
         '''
         Executes the given command.
 
@@ -79,15 +99,31 @@ class System:
         `command : str`
             The command to execute.
 
+        Returns
+        -------
+        `bool`
+            False if the command exits the program, True otherwise.
+
         Raises
         ------
         `AssertionError`
-            If the user's command is not in the `commands` dictionary.
+            If the user's command is not one of `COMMANDS`.
         '''
 
-        assert command in self.commands
-
-        self.commands[command]()
+        match command:
+            case 'play':
+                self.select_game_mode()
+            case 'help':
+                print_help()
+            case 'options':
+                self.options()
+            case 'exit':
+                print_exit()
+                return False
+            case _:
+                raise AssertionError(f'Unknown command: {command}')
+
+        return True
 
     def select_game_mode(self) -> None:
         '''
@@ -95,8 +131,6 @@ class System:
 
         Raises
         ------
-        `AssertionError`
-            If the user's command is not in the `commands` dictionary.
         `ValueError`
             If the game mode is not recognized or if the user enters an unknown option in
             the play menu.
@@ -104,19 +138,16 @@ class System:
 
         console.clear_playing()
 
-        res = console.get_list_input('Select a game mode', ['Standard Chess', 'Chess960'])
+        res = console.get_list_input_fast('Select a game mode', _GAME_MODE_CHOICES)
 
         console.clear_playing(res)
 
         game: Game
 
         try:
-            if res == 'Standard Chess':
-                game = StandardGame()
-            elif res == 'Chess960':
-                game = Chess960Game()
-            else:
+            if (factory := _MODE_FACTORIES.get(res)) is None:
                 raise ValueError('Unknown game mode')
+            game = factory()
         except (ValueError, InvalidFenError) as error:
             print(error)
             return
@@ -174,54 +205,54 @@ def play_game(game: Game, game_mode: str) -> None:
         If the user enters an unknown option in the play menu.
     '''
 
-    playing = True
-
-    msg: Optional[str] = None
+    from .models.game import GameOver
 
-    while playing:
-        console.clear_playing(game_mode)
-
-        console.print_game(game)
-        console.print_turn(game.turn)
+    playing = True
 
-        if msg:
-            print(msg)
-            msg = None
+    msg = '' # message for the next frame, including its line breaks
 
-        move_option = 'move'
-        undo_option = '<--'
-        redo_option = '-->'
-        exit_option = 'exit'
+    def stop() -> None:
+        nonlocal playing
+        playing = False
+        console.clear()
 
-        res = console.get_list_input(
-            'Select an option',
-            [move_option, undo_option, redo_option, exit_option]
-        )
+    handlers: dict[str, Callable[[], None]] = {
+        _MOVE: partial(get_next_move, game),
+        _UNDO: game.undo,
+        _REDO: game.redo,
+        _EXIT: stop,
+    }
 
-        if res == move_option:
-            try:
-                get_next_move(game)
-            except (InvalidMoveInputError, IllegalMoveError) as error:
-                msg = f'error: {error}\n'
-            except GameOver as error:
-                console.print_game_over(game, error)
-                playing = False
-                console.clear()
+    def position() -> bytes: # the last position recorded, none before the first move
+        history = game.move_history
+        return history[-1] if history else b''
 
+    shown: Optional[bytes] = None # position of the board on screen
 
-        elif res == undo_option:
-            game.undo()
+    while playing:
+        current = position()
+        if current != shown: # only a changed position needs a whole frame
+            console.print_playing(game_mode, game, msg)
+            shown = current
+        else: # the board is still on screen, only the lines under it change
+            console.print_message(game_mode, game, msg)
+        msg = ''
 
-        elif res == redo_option:
-            game.redo()
+        res = console.get_list_input_fast('Select an option', _PLAY_CHOICES)
 
-        elif res == exit_option:
-            playing = False
-            console.clear()
+        handler = handlers.get(res)
 
-        else:
+        if handler is None:
             raise ValueError('Unknown option')
 
+        try:
+            handler()
+        except (InvalidMoveInputError, IllegalMoveError) as error:
+            msg = f'error: {error}\n\n'
+        except GameOver as error:
+            console.print_game_over(game, error)
+            stop()
+
 def get_next_move(game: Game) -> None:
     '''
     Gets the next move from the user and executes it.
@@ -242,3 +273,17 @@ def get_next_move(game: Game) -> None:
     res = console.get_text_input('Enter a move')
 
     game.move(res)
+
+def print_help() -> None:
+    '''
+    Prints the commands of the menu.
+    '''
+
+    print(_HELP_MSG)
+
+def print_exit() -> None:
+    '''
+    Prints the exit message.
+    '''
+
+    print(_EXIT_MSG)